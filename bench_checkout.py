@@ -0,0 +1,81 @@
+# Fires N simultaneous checkouts at a handful of hot products and checks that
+# stock is never oversold: every product's final stock must equal its initial
+# stock minus the units on accepted orders, and never drop below zero. Baskets
+# list their products in random order to provoke lock-ordering deadlocks.
+#
+# Defaults to a fresh SQLite file; DATABASE_URL can point it at a scratch MySQL
+# database instead (it adds rows, it never deletes any).
+#
+# --queue routes the checkouts through the buffered order queue instead.
+#
+#   python bench_checkout.py [checkouts] [--queue]
+import collections
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from app import create_app, db, Customer, Product, order_product
+
+PRODUCTS = 5
+INITIAL_STOCK = 60
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != '--queue']
+    checkouts = int(args[0]) if args else 200
+    queued = '--queue' in sys.argv
+    os.environ.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'checkout.db'))
+    app = create_app({'SAMPLER_ENABLED': False, 'ORDER_QUEUE_ENABLED': queued})
+    with app.app_context():
+        db.create_all()
+        customer = Customer(name='bench', email='bench@example.com', phone='1')
+        products = [Product(name=f"hot {i}", price=9.99, stock=INITIAL_STOCK) for i in range(PRODUCTS)]
+        db.session.add_all([customer, *products])
+        db.session.commit()
+        customer_id = customer.id
+        product_ids = [product.id for product in products]
+
+    statuses = collections.Counter()
+    lock = threading.Lock()
+    barrier = threading.Barrier(checkouts)
+
+    def checkout(seed):
+        rng = random.Random(seed)
+        ids = rng.sample(product_ids, rng.randint(1, PRODUCTS))
+        lines = [{'product_id': product_id, 'quantity': rng.randint(1, 3)} for product_id in ids]
+        barrier.wait()
+        response = app.test_client().post('/order', json={'customer_id': customer_id, 'lines': lines,
+                                                           'order_date': '2024-01-01'})
+        with lock:
+            statuses[response.status_code] += 1
+
+    threads = [threading.Thread(target=checkout, args=(seed,)) for seed in range(checkouts)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        stock = dict(db.session.execute(
+            db.select(Product.id, Product.stock).where(Product.id.in_(product_ids))).all())
+        sold = dict(db.session.execute(
+            db.select(order_product.c.product_id, db.func.sum(order_product.c.quantity))
+            .where(order_product.c.product_id.in_(product_ids))
+            .group_by(order_product.c.product_id)).all())
+    print(f"{'queued' if queued else 'direct'}: {checkouts} checkouts in {elapsed:.2f}s  ({checkouts / elapsed:.0f}/s)  "
+          f"statuses {dict(sorted(statuses.items()))}")
+    for product_id in sorted(stock):
+        print(f"product {product_id}: stock {INITIAL_STOCK} -> {stock[product_id]}, "
+              f"sold {sold.get(product_id, 0)}")
+    assert set(statuses) <= {201, 409}, "unexpected responses"
+    for product_id, level in stock.items():
+        assert level >= 0, f"product {product_id} oversold"
+        assert level == INITIAL_STOCK - sold.get(product_id, 0), f"product {product_id} lost an update"
+    print("no oversell")
+
+if __name__ == '__main__':
+    main()
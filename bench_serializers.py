@@ -0,0 +1,55 @@
+# Compares marshmallow Schema(many=True).jsonify against the compiled serializers
+# on 10k rows, and checks that both produce byte-identical bodies. Each side
+# gets what its list endpoint serializes: marshmallow the loaded ORM objects
+# (as the endpoints did before), the compiled serializers the Row tuples of the
+# projections the endpoints now run.
+#
+#   DATABASE_URL=sqlite:// python bench_serializers.py [rows]
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from app import (create_app, db, Customer, CustomerAccount, Order, Product,
+                 customers_schema, customers_serializer, customers_projection,
+                 customer_accounts_schema, customer_accounts_serializer, customer_accounts_projection,
+                 products_schema, products_serializer, products_projection,
+                 orders_schema, orders_serializer, orders_projection)
+
+def make_rows(count):
+    start = datetime(2024, 1, 1)
+    return {
+        'products': [Product(id=i, name=f"Product {i}", price=i * 1.25, stock=i % 100) for i in range(count)],
+        'customers': [Customer(id=i, name=f"Customer {i}", email=f"customer{i}@example.com", phone=str(5550000 + i))
+                      for i in range(count)],
+        'customer_accounts': [CustomerAccount(id=i, username=f"user{i}", password="secret", customer_id=i)
+                              for i in range(count)],
+        'orders': [Order(id=i, customer_id=i % 500, quantity=i % 7 + 1, total=i * 2.5,
+                         order_date=start + timedelta(seconds=i)) for i in range(count)],
+    }
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    pairs = {
+        'products': (products_schema, products_serializer, products_projection),
+        'customers': (customers_schema, customers_serializer, customers_projection),
+        'customer_accounts': (customer_accounts_schema, customer_accounts_serializer, customer_accounts_projection),
+        'orders': (orders_schema, orders_serializer, orders_projection),
+    }
+    with create_app().app_context():
+        db.create_all()
+        for objects in make_rows(count).values():
+            db.session.add_all(objects)
+        db.session.commit()
+        for name, (schema, serializer, projection) in pairs.items():
+            objects = db.session.scalars(db.select(projection.column_descriptions[0]['entity'])).all()
+            rows = db.session.execute(projection).all()
+            expected = schema.jsonify(objects).get_data()
+            actual = serializer.jsonify(rows).get_data()
+            assert actual == expected, f"{name}: compiled output differs from marshmallow"
+            slow = min(timeit.repeat(lambda: schema.jsonify(objects), number=1, repeat=5))
+            fast = min(timeit.repeat(lambda: serializer.jsonify(rows), number=1, repeat=5))
+            print(f"{name:<18} {count} rows  marshmallow {slow * 1000:8.1f} ms  "
+                  f"compiled {fast * 1000:8.1f} ms  {slow / fast:5.1f}x  identical")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+# Measures cold start: `import app` and `import app; app.create_app()` each run in a
+# fresh interpreter, reporting the median wall time over several runs. Importing
+# the module must not open a database connection or start any threads.
+#
+# Most of that is the framework stack (Flask, SQLAlchemy, marshmallow), which
+# also pulls in werkzeug.serving, click, csv, concurrent.futures and the MySQL
+# dialect, so the `module` line times app.py alone: in the same fresh
+# interpreter, after those dependencies are already imported.
+#
+#   python bench_startup.py [runs]
+import statistics
+import subprocess
+import sys
+import time
+
+DEPENDENCIES = "import flask, flask_cors, flask_marshmallow, flask_sqlalchemy, sqlalchemy.ext.associationproxy"
+
+STAGES = {
+    'import': "import app",
+    'create_app': "import app; app.create_app()",
+}
+
+def measure(code, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def measure_module(runs):
+    code = f"{DEPENDENCIES}; import time; start = time.perf_counter(); import app; print(time.perf_counter() - start)"
+    return [float(subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout)
+            for _ in range(runs)]
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    baseline = statistics.median(measure("pass", runs))
+    for name, code in STAGES.items():
+        timings = measure(code, runs)
+        median = statistics.median(timings)
+        print(f"{name:<12} median {median * 1000:7.1f} ms  "
+              f"(interpreter {baseline * 1000:.1f} ms, app {(median - baseline) * 1000:7.1f} ms)  "
+              f"min {min(timings) * 1000:7.1f} ms  max {max(timings) * 1000:7.1f} ms")
+    timings = measure_module(runs)
+    print(f"{'module':<12} median {statistics.median(timings) * 1000:7.1f} ms  "
+          f"min {min(timings) * 1000:7.1f} ms  max {max(timings) * 1000:7.1f} ms")
+
+if __name__ == '__main__':
+    main()
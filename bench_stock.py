@@ -0,0 +1,64 @@
+# Hammers PATCH /product/<id>/stock on a few hot products from many threads,
+# once with direct conditional UPDATEs and once with the write-behind
+# coalescer, and checks both end at the same stock levels.
+#
+#   python bench_stock.py [threads] [requests_per_thread]
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from app import create_app, db, Product
+
+HOT_PRODUCTS = 3
+INITIAL_STOCK = 1000000
+
+def run(coalesce, threads, requests):
+    directory = tempfile.mkdtemp()
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': os.environ.get('DATABASE_URL', 'sqlite:///' + os.path.join(directory, 'stock.db')),
+        'STOCK_COALESCE_ENABLED': coalesce,
+        'STOCK_JOURNAL_DIR': os.path.join(directory, 'journal'),
+        'SAMPLER_ENABLED': False,
+    })
+    with app.app_context():
+        db.create_all()
+        products = [Product(name=f"hot {i}", price=1, stock=INITIAL_STOCK) for i in range(HOT_PRODUCTS)]
+        db.session.add_all(products)
+        db.session.commit()
+        ids = [product.id for product in products]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(offset):
+        client = app.test_client()
+        barrier.wait()
+        for i in range(requests):
+            product_id = ids[(offset + i) % len(ids)]
+            client.patch(f'/product/{product_id}/stock', json={'stock': -1 if i % 4 else 2})
+
+    workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    with app.app_context():
+        app.extensions['stock_coalescer'].close()
+        elapsed = time.perf_counter() - start
+        stock = db.session.execute(db.select(Product.stock).where(Product.id.in_(ids)).order_by(Product.id)).scalars().all()
+    total = threads * requests
+    print(f"{'coalesced' if coalesce else 'direct':<10} {total} adjustments in {elapsed:6.2f}s  "
+          f"{total / elapsed:8.0f}/s  stock {stock}")
+    return stock
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    direct = run(False, threads, requests)
+    coalesced = run(True, threads, requests)
+    assert direct == coalesced, "coalesced run ended at different stock levels"
+
+if __name__ == '__main__':
+    main()